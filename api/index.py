@@ -1,17 +1,12 @@
-from flask import Flask, jsonify
-from flask_cors import CORS
 import sys
 import os
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-app = Flask(__name__)
-CORS(app)
-
-@app.route('/')
-def health_check():
-    return jsonify({"status": "Backend is running", "message": "Odoo Reporter API"})
+# All routes live on the shared app so every function reuses the same
+# lazily-constructed reporter instead of rebuilding it per request.
+from app import app
 
 # Vercel handler
 def handler(event, context):
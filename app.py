@@ -1,42 +1,111 @@
-from flask import Flask, jsonify
+# Monkey-patch before anything else imports sockets so requests' I/O waits
+# yield to other greenlets. Run with:
+#   gunicorn -k gevent -w 2 --worker-connections 500 app:app
+# The patch is optional so the app still runs where gevent isn't installed
+# (e.g. the Vercel functions under api/).
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
+from flask import Flask, jsonify, request, send_file
 from flask_cors import CORS
+from cachetools import TTLCache
+import functools
+import hashlib
+import orjson
 import os
 from odoo_reporter_local import OdooSubscriptionReporter
-from excel_exporter import create_excel_report_base64
+from excel_exporter import create_excel_report_base64, create_excel_report_buffer
 
 app = Flask(__name__)
 CORS(app)
 
+# Generating a report means several seconds of Odoo RPCs; cache the rendered
+# response bodies briefly so rapid repeat hits are served from memory, and
+# hand clients an ETag so unchanged payloads come back as a bodyless 304.
+_response_cache = TTLCache(maxsize=8, ttl=60)
+
+def _etag_response(body: bytes, mimetype: str = 'application/json'):
+    etag = hashlib.md5(body).hexdigest()
+    if request.if_none_match.contains(etag):
+        return app.response_class(status=304)
+    response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(etag)
+    return response
+
 # Vercel handler
 def handler(request):
     return app(request.environ, lambda status, headers: None)
 
+@functools.lru_cache(maxsize=1)
+def _get_reporter() -> OdooSubscriptionReporter:
+    """Build the reporter once per process so its connection pool and partner
+    cache warm across requests instead of being rebuilt per hit. Failures are
+    not cached, so a fixed configuration takes effect on the next request."""
+    return OdooSubscriptionReporter()
+
 @app.route('/')
+@app.route('/api/index')
 def health_check():
     return jsonify({"status": "Backend is running", "message": "Odoo Reporter API"})
 
 @app.route('/api/reports')
 def get_reports():
     try:
-        reporter = OdooSubscriptionReporter()
-        reports_data = reporter.generate_structured_reports()
-        return jsonify(reports_data)
+        body = _response_cache.get('reports')
+        if body is None:
+            reporter = _get_reporter()
+            reports_data = reporter.generate_structured_reports()
+            # orjson serializes the large nested report list several times
+            # faster than jsonify's stdlib encoder and emits bytes directly.
+            body = orjson.dumps(reports_data)
+            _response_cache['reports'] = body
+        return _etag_response(body)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
 
-@app.route('/api/reports/excel')
-def get_excel_report():
+@app.route('/api/reports/excel/raw')
+def get_excel_report_raw():
+    """Serve the XLSX bytes directly, skipping the 33% base64 inflation."""
     try:
-        reporter = OdooSubscriptionReporter()
+        reporter = _get_reporter()
         reports_data = reporter.generate_structured_reports()
-        
+
         if not reports_data:
             return jsonify({"error": "No data available to generate Excel report."}), 400
-        
-        base64_excel = create_excel_report_base64(reports_data)
-        return jsonify({"fileContent": base64_excel})
+
+        buffer = create_excel_report_buffer(reports_data)
+        return send_file(
+            buffer,
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            as_attachment=True,
+            download_name='report.xlsx',
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
+
+@app.route('/api/reports/excel')
+@app.route('/api/excel')
+def get_excel_report():
+    try:
+        body = _response_cache.get('reports_excel')
+        if body is None:
+            reporter = _get_reporter()
+            reports_data = reporter.generate_structured_reports()
+
+            if not reports_data:
+                return jsonify({"error": "No data available to generate Excel report."}), 400
+
+            base64_excel = create_excel_report_base64(reports_data)
+            body = orjson.dumps({"fileContent": base64_excel})
+            _response_cache['reports_excel'] = body
+        return _etag_response(body)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
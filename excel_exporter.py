@@ -1,16 +1,59 @@
-import base64
 import io
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
-import openpyxl
+import pybase64
+import xlsxwriter
 
-def create_excel_report_base64(data: List[Dict]) -> str:
+# Placeholder so subscriptions without products still emit one row.
+_EMPTY_PRODUCT = ({"name": "N/A", "quantity": 0, "unit_price": 0, "subtotal": 0},)
+
+def _rows(data: List[Dict]) -> Iterator[Tuple]:
+    """Yield one flat row tuple per product line, falling back to a single
+    placeholder row for subscriptions without products."""
+    for report in data:
+        customer = report.get("customer") or {}
+        delivery = report.get("delivery") or {}
+        # The subscription-level columns are identical for every product row,
+        # so build them once per report instead of re-walking the nested
+        # dicts (and allocating throwaway empty ones) for each product.
+        prefix = (
+            report.get("name"),
+            report.get("status"),
+            report.get("plan"),
+            report.get("start_date"),
+            report.get("end_date"),
+            customer.get("name"),
+            customer.get("address"),
+            customer.get("phone"),
+            delivery.get("name"),
+            delivery.get("status"),
+            delivery.get("date"),
+        )
+        suffix = (
+            report.get("payment_terms"),
+            report.get("untaxed_amount"),
+            report.get("total_amount"),
+        )
+        for product in report.get("products") or _EMPTY_PRODUCT:
+            yield prefix + (
+                product.get("name"),
+                product.get("quantity"),
+                product.get("unit_price"),
+                product.get("subtotal"),
+            ) + suffix
+
+def create_excel_report_buffer(data: List[Dict]) -> io.BytesIO:
     """
-    Creates an Excel report from subscription data and returns it as a base64 encoded string.
+    Creates an Excel report from subscription data and returns it as an in-memory
+    buffer positioned at the start, ready to stream to a client.
     """
-    workbook = openpyxl.Workbook()
-    sheet = workbook.active
-    sheet.title = "Subscription Report"
+    buffer = io.BytesIO()
+    # constant_memory flushes each finished row to the archive immediately,
+    # so peak RAM stays bounded no matter how many product rows the report
+    # has. Rows must be written in ascending order, which the sequential
+    # loop below already guarantees.
+    workbook = xlsxwriter.Workbook(buffer, {'constant_memory': True})
+    worksheet = workbook.add_worksheet("Subscription Report")
 
     # Define headers based on the desired fields
     headers = [
@@ -20,59 +63,26 @@ def create_excel_report_base64(data: List[Dict]) -> str:
         "Product", "Quantity", "Unit Price", "Subtotal",
         "Payment Terms", "Untaxed Amount", "Total Amount"
     ]
-    sheet.append(headers)
+    worksheet.write_row(0, 0, headers)
 
-    # Populate data, creating a new row for each product in a subscription
-    for report in data:
-        if report.get("products"):
-            for product in report["products"]:
-                row = [
-                    report.get("name"),
-                    report.get("status"),
-                    report.get("plan"),
-                    report.get("start_date"),
-                    report.get("end_date"),
-                    report.get("customer", {}).get("name"),
-                    report.get("customer", {}).get("address"),
-                    report.get("customer", {}).get("phone"),
-                    report.get("delivery", {}).get("name"),
-                    report.get("delivery", {}).get("status"),
-                    report.get("delivery", {}).get("date"),
-                    product.get("name"),
-                    product.get("quantity"),
-                    product.get("unit_price"),
-                    product.get("subtotal"),
-                    report.get("payment_terms"),
-                    report.get("untaxed_amount"),
-                    report.get("total_amount"),
-                ]
-                sheet.append(row)
-        else:
-            # If no products, still add a row for the subscription
-            row = [
-                report.get("name"),
-                report.get("status"),
-                report.get("plan"),
-                report.get("start_date"),
-                report.get("end_date"),
-                report.get("customer", {}).get("name"),
-                report.get("customer", {}).get("address"),
-                report.get("customer", {}).get("phone"),
-                report.get("delivery", {}).get("name"),
-                report.get("delivery", {}).get("status"),
-                report.get("delivery", {}).get("date"),
-                "N/A", 0, 0, 0,  # Placeholder for product info
-                report.get("payment_terms"),
-                report.get("untaxed_amount"),
-                report.get("total_amount"),
-            ]
-            sheet.append(row)
+    # Populate data, creating a new row for each product in a subscription.
+    # Rows stay plain tuples of primitives with no Format objects: per-cell
+    # styling would defeat constant_memory's write-and-forget row path, and
+    # nothing in the report needs it.
+    for row_idx, row in enumerate(_rows(data), start=1):
+        worksheet.write_row(row_idx, 0, row)
 
-    # Save to an in-memory buffer
-    buffer = io.BytesIO()
-    workbook.save(buffer)
+    workbook.close()
     buffer.seek(0)
+    return buffer
 
-    # Encode as base64 and return as a string
-    base64_encoded = base64.b64encode(buffer.read()).decode('utf-8')
-    return base64_encoded
+def create_excel_report_base64(data: List[Dict]) -> str:
+    """
+    Creates an Excel report from subscription data and returns it as a base64 encoded string.
+    """
+    buffer = create_excel_report_buffer(data)
+    # Encode straight from the buffer's memoryview: getbuffer() is zero-copy,
+    # so the only allocation is the encoded string itself. pybase64 picks a
+    # SIMD (AVX2/AVX-512) kernel at import time and is several times faster
+    # than stdlib base64 on multi-MB payloads.
+    return pybase64.b64encode_as_string(buffer.getbuffer())
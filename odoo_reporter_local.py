@@ -1,8 +1,12 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
 import logging
+import orjson
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 import argparse
 from excel_exporter import create_excel_report_base64
@@ -11,6 +15,25 @@ from excel_exporter import create_excel_report_base64
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Built once at import time; map_status/map_delivery_status run per
+# subscription, so rebuilding these dicts per call was pure churn.
+_STATUS_MAP = {
+    '4_close': 'Closed',
+    '6_churn': 'Churned',
+    '3_pending': 'Pending',
+    '2_open': 'Active',
+    '1_draft': 'Draft'
+}
+
+_DELIVERY_STATUS_MAP = {
+    'draft': 'Draft',
+    'waiting': 'Waiting',
+    'confirmed': 'Confirmed',
+    'assigned': 'Preparation',
+    'done': 'Delivered',
+    'cancel': 'Cancelled'
+}
+
 class OdooSubscriptionReporter:
     def __init__(self):
         """Initializes the reporter, loading configuration from environment variables."""
@@ -25,6 +48,26 @@ class OdooSubscriptionReporter:
             logger.error(msg)
             raise ValueError(msg)
 
+        # Reuse one HTTPS connection across all RPCs instead of paying a
+        # fresh TCP+TLS handshake per call, with a small retry budget for
+        # transient upstream failures.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Ask Odoo for compressed JSON explicitly; requests decodes it
+        # transparently, and compressed search_read payloads are typically
+        # 5-10x smaller on the wire.
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+        # Many subscriptions share a customer; cache partner reads per
+        # reporter instance so each partner is fetched at most once.
+        self._partner_cache: Dict[int, Dict] = {}
+
     def _make_request(self, model: str, method: str, args: List, kwargs: Dict = None) -> Dict:
         payload = {
             "jsonrpc": "2.0",
@@ -36,9 +79,12 @@ class OdooSubscriptionReporter:
             }
         }
         try:
-            response = requests.post(self.url, json=payload, timeout=30)
+            response = self.session.post(self.url, json=payload, timeout=30)
             response.raise_for_status()
-            result = response.json()
+            # orjson decodes the raw bytes several times faster than
+            # response.json()'s stdlib parser, which matters for large
+            # search_read payloads.
+            result = orjson.loads(response.content)
             if 'error' in result:
                 logger.error(f"Odoo API Error: {result['error']}")
             return result.get('result', [])
@@ -55,8 +101,10 @@ class OdooSubscriptionReporter:
         # This script will now fetch ALL sale orders. For accurate subscription reporting,
         # please install the "Subscriptions" application in your Odoo database.
         domain = []
+        # Only fields actually consumed downstream; search_read returns the
+        # id regardless, so it needn't be requested explicitly.
         fields = [
-            "id", "name", "subscription_state", "plan_id", "date_order", 
+            "name", "subscription_state", "plan_id", "date_order",
             "partner_id", "order_line", "payment_term_id",
             "amount_untaxed", "amount_total"
         ]
@@ -79,32 +127,68 @@ class OdooSubscriptionReporter:
     def get_customer_details(self, partner_id: int) -> Dict:
         if not partner_id:
             return {}
-            
-        fields = ["name", "street", "street2", "city", "state_id", "country_id", "phone", "email"]
+
+        if partner_id in self._partner_cache:
+            return self._partner_cache[partner_id]
+
+        fields = ["name", "street", "street2", "city", "state_id", "country_id", "phone"]
         # The result of a read is a list, so we take the first element.
         details = self._make_request("res.partner", "read", [[partner_id]], {"fields": fields})
-        return details[0] if details else {}
+        if details:
+            self._partner_cache[partner_id] = details[0]
+            return details[0]
+        return {}
 
     def get_order_lines(self, line_ids: List[int]) -> List[Dict]:
         if not line_ids:
             return []
             
-        fields = ["product_id", "name", "product_uom_qty", "price_unit", "price_subtotal"]
+        fields = ["name", "product_uom_qty", "price_unit", "price_subtotal"]
         return self._make_request("sale.order.line", "read", [line_ids], {"fields": fields})
 
     def get_delivery_orders(self, origin: str) -> List[Dict]:
         if not origin:
             return []
-            
+
         domain = [("origin", "=", origin), ("picking_type_id.code", "=", "outgoing")]
         fields = ["name", "state", "scheduled_date"]
         return self._make_request(
-            "stock.picking", 
-            "search_read", 
-            [domain], 
+            "stock.picking",
+            "search_read",
+            [domain],
             {"fields": fields, "order": "scheduled_date desc", "limit": 1}
         )
 
+    def get_customers_details(self, partner_ids: List[int]) -> List[Dict]:
+        """Batch variant of get_customer_details: one read for all partners."""
+        if not partner_ids:
+            return []
+
+        missing = [pid for pid in partner_ids if pid not in self._partner_cache]
+        if missing:
+            fields = ["name", "street", "street2", "city", "state_id", "country_id", "phone"]
+            for customer in self._make_request("res.partner", "read", [missing], {"fields": fields}):
+                self._partner_cache[customer['id']] = customer
+        return [self._partner_cache[pid] for pid in partner_ids if pid in self._partner_cache]
+
+    def get_delivery_orders_for_origins(self, origins: List[str]) -> List[Dict]:
+        """Batch variant of get_delivery_orders: one search across all origins.
+
+        Results are ordered newest-first so the first picking seen per origin
+        is the latest one.
+        """
+        if not origins:
+            return []
+
+        domain = [("origin", "in", origins), ("picking_type_id.code", "=", "outgoing")]
+        fields = ["name", "state", "scheduled_date", "origin"]
+        return self._make_request(
+            "stock.picking",
+            "search_read",
+            [domain],
+            {"fields": fields, "order": "scheduled_date desc"}
+        )
+
     def get_many2one_value(self, field_value: Union[bool, list], default: str = "Not Available") -> str:
         """Safely extract value from Many2one field"""
         if isinstance(field_value, list) and len(field_value) > 1:
@@ -118,18 +202,19 @@ class OdooSubscriptionReporter:
         return 0
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def format_date(date_str: str) -> str:
         if not date_str:
             return "Not Available"
+        # Odoo always returns ISO 8601 (YYYY-MM-DD[ HH:MM:SS]), so slicing
+        # out the date parts avoids strptime's regex machinery entirely.
+        # The cache helps because many subscriptions share order dates.
         try:
-            # Handle both date and datetime formats
-            if ' ' in date_str:
-                dt_obj = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-            else:
-                dt_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            return dt_obj.strftime('%m/%d/%Y')
-        except (ValueError, TypeError):
-            return "Invalid Date"
+            if date_str[4] == '-' and date_str[7] == '-':
+                return f"{date_str[5:7]}/{date_str[8:10]}/{date_str[0:4]}"
+        except (IndexError, TypeError):
+            pass
+        return "Invalid Date"
 
     @staticmethod
     def format_address(customer: Dict) -> str:
@@ -145,26 +230,11 @@ class OdooSubscriptionReporter:
 
     @staticmethod
     def map_status(status: str) -> str:
-        status_mapping = {
-            '4_close': 'Closed',
-            '6_churn': 'Churned',
-            '3_pending': 'Pending',
-            '2_open': 'Active',
-            '1_draft': 'Draft'
-        }
-        return status_mapping.get(status, status.capitalize())
+        return _STATUS_MAP.get(status) or status.capitalize()
 
     @staticmethod
     def map_delivery_status(status: str) -> str:
-        status_mapping = {
-            'draft': 'Draft',
-            'waiting': 'Waiting',
-            'confirmed': 'Confirmed',
-            'assigned': 'Preparation',
-            'done': 'Delivered',
-            'cancel': 'Cancelled'
-        }
-        return status_mapping.get(status, status.capitalize())
+        return _DELIVERY_STATUS_MAP.get(status) or status.capitalize()
 
     def generate_structured_reports(self) -> List[Dict]:
         """Fetches subscriptions and formats them into a list of structured dictionaries."""
@@ -172,15 +242,39 @@ class OdooSubscriptionReporter:
         if not subscriptions:
             return []
         
+        # Batch the three per-subscription lookups into one RPC each instead
+        # of three round-trips per subscription (3N+1 calls down to 4).
+        partner_ids = {self.get_partner_id(s.get('partner_id', False)) for s in subscriptions}
+        partner_ids.discard(0)
+        origins = [s['name'] for s in subscriptions if s.get('name')]
+        all_line_ids = [line_id for s in subscriptions for line_id in s.get('order_line', [])]
+
+        # The three batch fetches are independent, so overlap their network
+        # latency; requests releases the GIL while waiting on the socket and
+        # the Session pool handles the concurrent connections.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            customers_future = executor.submit(self.get_customers_details, list(partner_ids))
+            lines_future = executor.submit(self.get_order_lines, all_line_ids)
+            deliveries_future = executor.submit(self.get_delivery_orders_for_origins, origins)
+
+            customers_by_id = {c['id']: c for c in customers_future.result()}
+            lines_by_id = {l['id']: l for l in lines_future.result()}
+            # Newest-first ordering means setdefault keeps the latest picking per origin.
+            deliveries_by_origin = {}
+            for picking in deliveries_future.result():
+                deliveries_by_origin.setdefault(picking.get('origin'), picking)
+
         reports_data = []
         for sub in subscriptions:
             try:
                 partner_id = self.get_partner_id(sub.get('partner_id', False))
-                customer = self.get_customer_details(partner_id)
-                origin = sub.get('name', '')
-                deliveries = self.get_delivery_orders(origin)
-                delivery = deliveries[0] if deliveries else {}
-                products = self.get_order_lines(sub.get('order_line', []))
+                customer = customers_by_id.get(partner_id, {})
+                delivery = deliveries_by_origin.get(sub.get('name', ''), {})
+                products = [
+                    lines_by_id[line_id]
+                    for line_id in sub.get('order_line', [])
+                    if line_id in lines_by_id
+                ]
 
                 reports_data.append({
                     "name": sub.get('name', 'N/A'),
@@ -200,7 +294,9 @@ class OdooSubscriptionReporter:
                     },
                     "products": [
                         {
-                            "name": p.get('name', 'N/A').split('\n')[0],
+                            # partition stops at the first newline without
+                            # building a list of every trailing segment.
+                            "name": (p.get('name') or 'N/A').partition('\n')[0],
                             "quantity": p.get('product_uom_qty', 0),
                             "unit_price": p.get('price_unit', 0),
                             "subtotal": p.get('price_subtotal', 0),